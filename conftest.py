@@ -8,6 +8,8 @@ The following code configures:
         Code taken from: https://loguru.readthedocs.io/en/stable/resources/migration.html#making-things-work-with-pytest-and-caplog
 
 3. Add --email and --username (required) CLI options to pytest.
+
+4. Add --integration CLI option to pytest. Tests marked integration are skipped unless it is provided.
 """
 import logging
 import pytest
@@ -38,13 +40,24 @@ def caplog(_caplog):
 def pytest_addoption(parser):
     parser.addoption("--email", action="store")
     parser.addoption("--username", action="store")
+    parser.addoption("--integration", action="store_true", default=False)
 
 
-@pytest.fixture
+def pytest_collection_modifyitems(config, items):
+    # Skip tests marked integration unless the --integration option is provided
+    if config.getoption("--integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="Provide --integration to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="session")
 def email(request: pytest.FixtureRequest) -> str:
     return request.config.getoption("--email")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def username(request: pytest.FixtureRequest) -> str:
     return request.config.getoption("--username")
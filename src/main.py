@@ -3,12 +3,6 @@
 Example usage: python ./src/main.py twitterusername example@email.com
 """
 import argparse
-import loguru
-
-# Local imports
-import modules.helpers as helpers
-import modules.botm as botm
-import modules.twitter as twtr
 
 
 def parse_args() -> argparse.Namespace:
@@ -41,42 +35,53 @@ def parse_args() -> argparse.Namespace:
 
 
 if __name__ == "__main__":
+    # Parse CLI arguments before importing anything else
+    # so --help and argument errors do not pay the import cost of the modules below
+    args = parse_args()
+    import concurrent.futures
+    import loguru
+
+    # Local imports
+    import modules.helpers as helpers
+
     # Initialise logging
     helpers.init_log_handler()
-    # Parse CLI arguments
-    args = parse_args()
     # Log username, email and demo arguments
+    # Let loguru format the message, the arguments are also added to the log record as structured fields
     loguru.logger.info(
-        f"Arguments - Username: @{args.username}, Recipient Email Address: {args.email}, Demo Mode: {args.demo}"
+        "Arguments - Username: @{username}, Recipient Email Address: {email}, Demo Mode: {demo}",
+        **vars(args),
+    )
+    # Get email credentials, required regardless of whether demo argument has or has not been provided
+    creds = helpers.get_env_vars(
+        [
+            "EMAIL_SERVER_DOMAIN",
+            "EMAIL_SERVER_PORT",
+            "EMAIL_SENDER_ADDRESS",
+            "EMAIL_SENDER_PASSWORD",
+        ]
     )
     # Check if the demo argument has been provided
     # to run the application in demo mode
     if args.demo:
-        # Get email credentials
-        creds = helpers.get_env_vars(
-            [
-                "EMAIL_SERVER_DOMAIN",
-                "EMAIL_SERVER_PORT",
-                "EMAIL_SENDER_ADDRESS",
-                "EMAIL_SENDER_PASSWORD",
-            ]
-        )
         loguru.logger.info("Demo argument provided, running application in demo mode.")
         # Get generated friends bot likelihood scores for the demo
         friends_bot_likelihood_scores = helpers.get_demo_friends_bot_likelihood_scores()
     else:
         # Demo argument has not been provided
-        # Get API and email credentials
-        creds = helpers.get_env_vars(
-            [
-                "TWITTER_API_KEY",
-                "TWITTER_API_SECRET",
-                "BOTOMETER_API_KEY",
-                "EMAIL_SERVER_DOMAIN",
-                "EMAIL_SERVER_PORT",
-                "EMAIL_SENDER_ADDRESS",
-                "EMAIL_SENDER_PASSWORD",
-            ]
+        # Only import the Twitter and Botometer modules when they are needed
+        import modules.botm as botm
+        import modules.twitter as twtr
+
+        # Get API credentials and add them to the email credentials
+        creds.update(
+            helpers.get_env_vars(
+                [
+                    "TWITTER_API_KEY",
+                    "TWITTER_API_SECRET",
+                    "BOTOMETER_API_KEY",
+                ]
+            )
         )
         # Authenticate to the Twitter API (using Tweepy) and Botometer API (using botometer-python)
         twitter_api = twtr.auth(
@@ -88,38 +93,63 @@ if __name__ == "__main__":
             consumer_key=creds["TWITTER_API_KEY"],
             consumer_secret=creds["TWITTER_API_SECRET"],
         )
-        # Get a list of the Twitter user's friends IDs
+        # Get a generator of the Twitter user's friends IDs
+        # Friends IDs are collected a page at a time
         friends_ids = twtr.get_friends_ids(api=twitter_api, username=args.username)
-        # Log friends IDs collected for debug purposes
-        loguru.logger.debug(f"Collected friends IDs: {friends_ids}")
         # Get a list of the Twitter user's friends bot likelihood scores
+        # Friends are checked as their IDs are collected
         friends_bot_likelihood_scores = botm.get_friends_bot_likelihood_scores(
             api=botometer_api, friends=friends_ids
         )
     # Run below regardless of whether demo argument has or has not been provided
-    # Get current datetime string to be used for the report render
-    datetime_str = helpers.get_datetime()
-    # Render friends bot likelihood report from the template
-    report_render = helpers.render_report(
-        username=args.username,
-        friends_bot_likelihood_scores=friends_bot_likelihood_scores,
-        datetime_str=datetime_str,
-    )
-    # Create reports directory to dump the friends bot likelihood report to
-    reports_dir = helpers.create_reports_dir()
-    # Dump the friends bot likelihood report to a file in the reports directory
-    report_file_path = helpers.dump_report(
-        report_render=report_render,
-        reports_dir=reports_dir,
-        username=args.username,
-    )
-    # Finally, send the email with the friends bot likelihood report attached
-    helpers.send_email_report(
-        email_server=creds["EMAIL_SERVER_DOMAIN"],
-        email_server_port=int(creds["EMAIL_SERVER_PORT"]),
-        email_sender_addr=creds["EMAIL_SENDER_ADDRESS"],
-        email_sender_pass=creds["EMAIL_SENDER_PASSWORD"],
-        email_recipient_addr=args.email,
-        report_file_path=report_file_path,
-        username=args.username,
-    )
+    # Connect to the email server in a background thread
+    # while the report is rendered and dumped to a file
+    # The thread pool is shut down once the email has been sent or an exception occurs
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        smtp_connection_future = executor.submit(
+            helpers.connect_email_server,
+            email_server=creds["EMAIL_SERVER_DOMAIN"],
+            email_server_port=int(creds["EMAIL_SERVER_PORT"]),
+            email_sender_addr=creds["EMAIL_SENDER_ADDRESS"],
+            email_sender_pass=creds["EMAIL_SENDER_PASSWORD"],
+        )
+        try:
+            # Get current datetime string to be used for the report render
+            datetime_str = helpers.get_datetime()
+            # Render friends bot likelihood report from the template
+            report_render = helpers.render_report(
+                username=args.username,
+                friends_bot_likelihood_scores=friends_bot_likelihood_scores,
+                datetime_str=datetime_str,
+            )
+            # Create reports directory to dump the friends bot likelihood report to
+            reports_dir = helpers.create_reports_dir()
+            # Dump the friends bot likelihood report to a file in the reports directory
+            report_file_path = helpers.dump_report(
+                report_render=report_render,
+                reports_dir=reports_dir,
+                username=args.username,
+            )
+        except BaseException:
+            # The email will not be sent, so cancel connecting to the email server if it has not started
+            # Otherwise close the connection once connected, which takes at most helpers.EMAIL_SERVER_TIMEOUT
+            # BaseException includes the SystemExit raised when an error is logged
+            if (
+                not smtp_connection_future.cancel()
+                and smtp_connection_future.exception() is None
+            ):
+                smtp_connection_future.result().close()
+            raise
+        # Finally, send the email with the friends bot likelihood report attached
+        helpers.send_email_report(
+            email_server=creds["EMAIL_SERVER_DOMAIN"],
+            email_server_port=int(creds["EMAIL_SERVER_PORT"]),
+            email_sender_addr=creds["EMAIL_SENDER_ADDRESS"],
+            email_sender_pass=creds["EMAIL_SENDER_PASSWORD"],
+            email_recipient_addr=args.email,
+            report_file_path=report_file_path,
+            username=args.username,
+            report_render=report_render,
+            # Wait for the connection to the email server
+            smtp_connection=smtp_connection_future.result(),
+        )
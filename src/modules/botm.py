@@ -3,6 +3,18 @@
 import botometer
 import requests
 import loguru
+import typing
+import collections
+import copy
+import threading
+import multiprocessing.pool
+
+# Number of friends to collect before logging their bot likelihood results
+LOG_BATCH_SIZE = 32
+# Number of threads used to check friends with the Botometer API concurrently
+MAX_WORKERS = 8
+# Each thread's `check_accounts_in` generator, started when the thread checks its first friend
+thread_local = threading.local()
 
 
 def auth(api_key: str, consumer_key: str, consumer_secret: str) -> botometer.Botometer:
@@ -30,70 +42,170 @@ def auth(api_key: str, consumer_key: str, consumer_secret: str) -> botometer.Bot
             wait_on_ratelimit=True,
         )
     except requests.exceptions.ConnectionError as err:
-        loguru.logger.exception(f"Failed to authenticate to the Botometer and Twitter APIs.\n{err}")
+        loguru.logger.exception(
+            "Failed to authenticate to the Botometer and Twitter APIs.\n{}", err
+        )
+
+
+def log_friends_results(friends_batch: list, friends_errors: list) -> None:
+    """Log the friends which Botometer has returned results or errors for, then clear the lists.
+
+    Used to emit a single log message for a batch of friends instead of one per friend.
+
+    Args:
+        friends_batch (list): A list containing tuples of username and ID for friends with bot likelihood results.
+        friends_errors (list): A list containing tuples of ID and error message for friends Botometer returned an error for.
+
+    Returns:
+        None.
+    """
+    if friends_batch:
+        loguru.logger.success(
+            "Got bot likelihood results from Botometer for {} friends: {}",
+            len(friends_batch),
+            friends_batch,
+        )
+        friends_batch.clear()
+    if friends_errors:
+        loguru.logger.warning(
+            "Botometer returned errors for {} friends: {}",
+            len(friends_errors),
+            friends_errors,
+        )
+        friends_errors.clear()
+
+
+def check_friend(api: botometer.Botometer, friend_id: int) -> tuple:
+    """Check a single Twitter friend using the Botometer API.
+
+    Each thread checks its friends with a single `check_accounts_in` generator, so the retries and
+    error handling of botometer-python are kept. Starting `check_accounts_in` creates a new botometer.Botometer
+    object, which requests a bearer token from the Twitter API, and updates the attributes of the object it is
+    called on. So the generator is started once per thread, on a shallow copy of `api`.
+
+    The cap and raw_scores keys are dropped from a successful result as soon as it is returned,
+    as they are not required and to save memory while the result waits to be processed.
+
+    Args:
+        api (botometer.Botometer): A botometer.Botometer object authenticated to the Botometer and Twitter API.
+        friend_id (int): The ID of the Twitter friend to check.
 
+    Returns:
+        tuple: A tuple containing the friend's ID and the result from the Botometer API.
+    """
+    # Start this thread's generator when it checks its first friend
+    # The generator takes each friend ID from the deque when it is resumed
+    if getattr(thread_local, "api", None) is not api:
+        thread_local.friends_ids = collections.deque()
+        thread_local.friends_results = copy.copy(api).check_accounts_in(
+            accounts=iter(thread_local.friends_ids.popleft, None),
+            full_user_object=False,
+            retries=3,
+        )
+        thread_local.api = api
+    thread_local.friends_ids.append(friend_id)
+    try:
+        friend_id, results = next(thread_local.friends_results)
+    except BaseException:
+        # The generator cannot be resumed after an exception, start a new one for the next friend
+        thread_local.api = None
+        raise
+    # Example JSON response: https://github.com/IUNetSci/botometer-python#botometer-v4
+    # Drop cap and raw_scores keys and values from the dictionary
+    # An error result does not contain these keys
+    results.pop("cap", None)
+    results.pop("raw_scores", None)
+    return friend_id, results
+
+
+def submit_friends(
+    pool: multiprocessing.pool.ThreadPool,
+    api: botometer.Botometer,
+    friends: typing.Iterable[int],
+) -> typing.Iterator[multiprocessing.pool.AsyncResult]:
+    """Submit Twitter friends to be checked by the thread pool.
+
+    Args:
+        pool (multiprocessing.pool.ThreadPool): The thread pool to check friends with.
+        api (botometer.Botometer): A botometer.Botometer object authenticated to the Botometer and Twitter API.
+        friends (typing.Iterable[int]): An iterable containing a Twitter account's friends (represented as IDs).
+
+    Returns:
+        typing.Iterator[multiprocessing.pool.AsyncResult]: An iterator of the result of each friend,
+            in the same order as the friends provided.
+
+    Notes:
+        Results which are ready are returned while the remaining friends are still being submitted,
+            so an exception is raised without waiting for the iterable to provide every friend.
+    """
+    async_results = collections.deque()
+    for friend_id in friends:
+        async_results.append(pool.apply_async(check_friend, (api, friend_id)))
+        while async_results and async_results[0].ready():
+            yield async_results.popleft()
+    yield from async_results
 
-def get_friends_bot_likelihood_scores(api: botometer.Botometer, friends: list) -> list:
+
+def get_friends_bot_likelihood_scores(
+    api: botometer.Botometer, friends: typing.Iterable[int]
+) -> list:
     """Get bot likelihood scores for Twitter friends.
 
     https://github.com/IUNetSci/botometer-python/blob/master/botometer/__init__.py#L140
 
     Args:
         api (botometer.Botometer): A botometer.Botometer object authenticated to the Botometer and Twitter API.
-        friends (list): A list containing a Twitter account's friends (represented as IDs).
+        friends (typing.Iterable[int]): An iterable containing a Twitter account's friends (represented as IDs).
+            For example, the generator returned by `twitter.get_friends_ids`.
 
     Returns:
         list: A list containing the bot likelihood scores for each Twitter friend.
+
+    Notes:
+        Friends are checked concurrently using a thread pool of `MAX_WORKERS` threads.
+            Each friend is submitted to the thread pool as soon as it is provided by the iterable.
+            Results are processed in the same order as the friends provided.
+            The threads are daemon threads, so a friend still being checked when an exception occurs
+            does not stop the application from exiting.
     """
     loguru.logger.info("Getting Twitter friends bot likelihood scores from Botometer.")
     # Initialise list containing each friend's bot likelihood score
     # List contains dictionaries with the bot likelihood scores for each friend
     friends_bot_likelihood_scores = []
+    # Initialise lists to batch log messages for friends
+    # Results are logged once per batch of friends and errors are logged once all friends have been checked
+    friends_batch = []
+    friends_errors = []
+    # Create thread pool to check friends concurrently
+    pool = multiprocessing.pool.ThreadPool(processes=MAX_WORKERS)
     try:
         # Get all friends bot likelihood scores from the Botometer API
         # Retry 3 times for each friend if an exception occurs
-        for friend_id, results in api.check_accounts_in(
-            accounts=friends, full_user_object=False, retries=3
-        ):
+        for async_result in submit_friends(pool=pool, api=api, friends=friends):
+            # Re-raises any exception which occurred when checking the friend
+            friend_id, results = async_result.get()
             # A TweepyError or NoTimelineError can occur when Botometer checks a friend
             # https://github.com/IUNetSci/botometer-python/blob/master/botometer/__init__.py#L153
             # When these occur the result is a dictionary containing an error message:
             # {"error": err_msg}
             # Check first if this type of result has been returned
-            error_msg = results.get("error", None)
-            if error_msg:
-                # Error message has been returned as the result
-                # Log a warning message
-                loguru.logger.warning(
-                    f"Botometer returned the following error for friend with ID: {friend_id}.\n{error_msg}"
-                )
+            # Errors are rare, so the successful response is handled when the key is missing
+            try:
+                error_msg = results["error"]
             # Got a successful response for this friend from the Botometer API
-            else:
-                # Example JSON response: https://github.com/IUNetSci/botometer-python#botometer-v4
-                # Drop cap and raw_scores keys and values from the dictionary
-                # As they are not required and to save memory
-                results.pop("cap")
-                results.pop("raw_scores")
+            except KeyError:
                 # Get friend's Twitter username (screen name)
                 friend_username = results["user"]["user_data"]["screen_name"]
-                loguru.logger.success(
-                    f"Got bot likelihood results from Botometer for friend: @{friend_username}, {friend_id}"
-                )
                 # Add friend's bot likelihood results to the list
-                loguru.logger.debug(
-                    f"Adding bot likelihood results for friend: @{friend_username}, {friend_id} to the list."
-                )
                 friends_bot_likelihood_scores.append(results)
-        # Check if the list has one or more results
-        if bool(friends_bot_likelihood_scores):
-            # The list contains at least one or more results
-            loguru.logger.debug(
-                "The friends bot likelihood scores list has one or more results."
-            )
-            return friends_bot_likelihood_scores
-        else:
-            # The list contains no results, log a terminating error
-            loguru.logger.exception("Failed to get any friends bot likelihood results.")
+                # Add friend to the batch and log the batch once it is full
+                friends_batch.append((friend_username, friend_id))
+                if len(friends_batch) >= LOG_BATCH_SIZE:
+                    log_friends_results(friends_batch=friends_batch, friends_errors=[])
+            else:
+                # Error message has been returned as the result
+                # Add the error to be logged once all friends have been checked
+                friends_errors.append((friend_id, error_msg))
     # The `check_accounts_in` method can raise the following exceptions once all retires have been exhausted:
     # requests: ConnectionError, HTTPError, Timeout
     ## https://github.com/IUNetSci/botometer-python/blob/master/botometer/__init__.py#L159
@@ -108,17 +220,21 @@ def get_friends_bot_likelihood_scores(api: botometer.Botometer, friends: list) -
         Exception,
     ) as err:
         loguru.logger.warning(
-            f"An exception occurred and all retries to Botometer have been exhausted.\n{err}"
+            "An exception occurred and all retries to Botometer have been exhausted.\n{}",
+            err,
+        )
+    finally:
+        # Stop the thread pool without waiting for any friends still being checked if an exception occurred
+        pool.terminate()
+    # Log the remaining batch of friends and any errors
+    log_friends_results(friends_batch=friends_batch, friends_errors=friends_errors)
+    # Check if the list has one or more results
+    if friends_bot_likelihood_scores:
+        # The list contains at least one or more results
+        loguru.logger.debug(
+            "The friends bot likelihood scores list has one or more results."
         )
-        # Check if the list has one or more results
-        if bool(friends_bot_likelihood_scores):
-            # The list contains at least one or more results
-            loguru.logger.debug(
-                "The friends bot likelihood scores list has one or more results."
-            )
-            return friends_bot_likelihood_scores
-        else:
-            # The list contains no results, log a terminating error
-            loguru.logger.exception(
-                f"Failed to get any friends bot likelihood results.\n{err}"
-            )
+        return friends_bot_likelihood_scores
+    else:
+        # The list contains no results, log a terminating error
+        loguru.logger.exception("Failed to get any friends bot likelihood results.")
@@ -3,78 +3,104 @@
 import loguru
 import sys
 import os
-import typing
 import datetime
-import pycountry
 import faker
 import jinja2
 import smtplib
 import ssl
 import socket
+import functools
 
-# Explicitly declare email imports
-from email import encoders
+# Explicitly declare email import
+# Due to -> AttributeError: module 'email' has no attribute 'message'
+from email.message import EmailMessage
 
-# Due to -> AttributeError: module 'email' has no attribute 'mime'
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
+# Local imports
+from modules.languages import LANGUAGE_NAMES
+
+# Size in bytes of the log file buffer
+LOG_FILE_BUFFER_SIZE = 1024 * 1024
+# Absolute paths to the src, template and reports directories
+# Resolved from the location of this module so they do not depend on the current working directory
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(SRC_DIR, "template")
+REPORTS_DIR = os.path.join(SRC_DIR, "reports")
+# Timeout in seconds for connecting and sending to the email server
+EMAIL_SERVER_TIMEOUT = 10
 
 # Logging functions
 
 
-def check_log_record_level(record: dict) -> typing.Tuple[bool, None]:
-    """A loguru filter to check each log record's level.
+def terminate_application(message: str) -> None:
+    """A loguru sink to terminate the application when an "ERROR" log message is emitted.
 
-    If the log record's level is "ERROR", then terminate the application.
-    Otherwise, return True, returning the log record back to the configured handler.
+    The sink is added last with a level of "ERROR", so the log message has already been sent
+    to the other log handlers when the application terminates.
 
     https://github.com/Delgan/loguru/issues/425
 
     Args:
-        record (dict): A log record containing metadata.
+        message (str): The formatted log message. Unused.
 
     Returns:
-        typing.Tuple[bool, None]: Returns a boolean of True or None.
-            Returns True when the log record level is not "ERROR".
-            Returns None when the log record level is "ERROR". Application terminates.
+        None. Application terminates.
     """
-    if record["level"].name == "ERROR":
-        exit()
-    return True
+    sys.exit(1)
 
 
 def init_log_handler() -> None:
     """Initialise log handlers using loguru.
 
-    Configures two log handlers:
+    Configures three log handlers:
 
     1. The default log handler (sys.stderr).
 
     2. A log handler with a sink configured to send log messages to a file.
 
+    3. A log handler with a sink configured to terminate the application
+        when an "ERROR" log message is emitted.
+
     The logging is application wide meaning log calls can be made anywhere
     as long as loguru is imported.
 
+    Both log handlers are enqueued, so log messages are written to the sinks by a background
+    thread instead of blocking the caller. The log file is buffered, so multiple log messages
+    are written to it at once.
+
     https://loguru.readthedocs.io/en/stable/api/logger.html#loguru._logger.Logger.configure
 
     Returns:
         None.
     """
     # Configuration for log handlers
-    # Specify formatting, filtering and other parameters
+    # Specify formatting, levels and other parameters
     # Diagnose is False to prevent leak of credentials in production
     log_handler_configs = {
         "handlers": [
             # Configure stderr log handler
-            {"sink": sys.stderr, "backtrace": True, "diagnose": False},
+            {
+                "sink": sys.stderr,
+                "backtrace": True,
+                "diagnose": False,
+                "enqueue": True,
+            },
             # Configure log handler to send log messages to a file
             {
                 "sink": "app_{time}.log",
                 "format": "{time:DD-MM-YYYY - HH:mm:ss} | {level} | {file}:{name}:{function}:{line} - {message}",
-                "filter": check_log_record_level,
                 "backtrace": True,
                 "diagnose": False,
+                "enqueue": True,
+                # Buffer the log file instead of writing each log message separately
+                "buffering": LOG_FILE_BUFFER_SIZE,
+            },
+            # Configure log handler to terminate the application on "ERROR" log messages
+            # loguru compares the log message level, so no filter is called for other log messages
+            # Not enqueued so the application terminates in the thread which emitted the log message
+            {
+                "sink": terminate_application,
+                "level": "ERROR",
+                "format": "{message}",
             },
         ]
     }
@@ -84,6 +110,12 @@ def init_log_handler() -> None:
 
 # Utility functions
 
+# Cache of environment variable names and values already retrieved by `get_env_vars`
+# Environment variables do not change for the lifetime of the application
+_env_vars_cache = {}
+# Format of the datetime string used in the friends bot likelihood report
+DATETIME_FORMAT = "%d/%m/%Y at %H:%M:%S"
+
 
 def get_env_vars(env_vars: list) -> dict:
     """Get a dictionary containing the provided environment variable(s) name(s) and value(s).
@@ -91,33 +123,50 @@ def get_env_vars(env_vars: list) -> dict:
     Args:
         env_vars (list): A list of environment variable name(s) to retrieve the value(s) for.
 
-    Raises:
-        ValueError: Occurs when an environment variable value is None.
-
     Returns:
         dict: A dictionary containing the environment variable name(s) and value(s) as key value pairs.
+
+    Notes:
+        Environment variable values which are found are cached and returned on subsequent calls
+        without reading `os.environ` again. Use `clear_env_vars_cache` to clear the cache.
+        A missing environment variable is logged as an error, which terminates the application.
     """
-    loguru.logger.info(f"Getting environment variables: {env_vars}")
-    # Initialise environment variable dictionary
-    env_vars_dict = {}
+    loguru.logger.info("Getting environment variables: {}", env_vars)
+    # Get the values of environment variables which have not already been retrieved
+    # Only environment variables which are present are added to the cache
+    _env_vars_cache.update(
+        {
+            env_var: env_var_value
+            for env_var in env_vars
+            if env_var not in _env_vars_cache
+            and (env_var_value := os.environ.get(env_var, None)) is not None
+        }
+    )
+    # Log an error for any environment variables which are missing
+    # Not raised from an exception, so there is no traceback to log with `exception`
     for env_var in env_vars:
-        # Get environment variable value
-        # Default to None if not found
-        env_var_value = os.environ.get(env_var, None)
-        # Check env_var_value is not None
-        # If None log error
-        if env_var_value is not None:
-            # Is present as a str
-            loguru.logger.debug(
-                f"Environment variable: {env_var} found. Adding to dictionary."
-            )
-            # Add environment variable name and value to env_vars_dict
-            env_vars_dict[env_var] = env_var_value
-        else:
-            loguru.logger.exception(
-                f"Environment variable: {env_var} is missing. See prerequisite steps in the README file."
+        if env_var not in _env_vars_cache:
+            loguru.logger.error(
+                "Environment variable: {} is missing. See prerequisite steps in the README file.",
+                env_var,
             )
-    return env_vars_dict
+    # Return the environment variable names and values which were found
+    return {
+        env_var: _env_vars_cache[env_var]
+        for env_var in env_vars
+        if env_var in _env_vars_cache
+    }
+
+
+def clear_env_vars_cache() -> None:
+    """Clear the environment variables cached by `get_env_vars`.
+
+    The next call to `get_env_vars` reads the environment variables from `os.environ` again.
+
+    Returns:
+        None.
+    """
+    _env_vars_cache.clear()
 
 
 def get_datetime() -> str:
@@ -129,8 +178,8 @@ def get_datetime() -> str:
         str: A string formatted with the current date and time like: "05/04/2021 at 13:04:15".
     """
     loguru.logger.info("Getting current datetime string.")
-    datetime_str = datetime.datetime.now().strftime("%d/%m/%Y at %H:%M:%S")
-    loguru.logger.debug(f"Datetime string: {datetime_str}")
+    datetime_str = datetime.datetime.now().strftime(DATETIME_FORMAT)
+    loguru.logger.debug("Datetime string: {}", datetime_str)
     return datetime_str
 
 
@@ -144,46 +193,40 @@ def get_lang_from_code(lang_code: str) -> str:
     Returns:
         str: The name of the language if available. Otherwise, returns "Unknown".
     """
-    loguru.logger.info(f"Getting language name for code: {lang_code}")
     # Lookup language using ISO 639-1 language code provided by the Botometer API
-    language = pycountry.languages.get(alpha_2=lang_code)
-    # Check a language has been returned
-    if language:
-        # Get language name and return it
-        language_name = language.name
-        loguru.logger.debug(f"Got language name: {language_name}")
-        return language.name
-    # If not, return "Unknown"
-    else:
-        loguru.logger.debug(f"Language name for code: {lang_code} is unknown.")
-        return "Unknown"
+    # If a language name is not found, return "Unknown"
+    # Lowercase the language code, as ISO 639-1 language codes are matched case-insensitively
+    # Called once per friend when rendering the report, so only a single debug message is logged
+    language_name = LANGUAGE_NAMES.get(lang_code.lower(), "Unknown")
+    loguru.logger.debug("Language name for code: {} is {}.", lang_code, language_name)
+    return language_name
 
 
-def create_reports_dir(reports_dir: str = f"{os.getcwd()}/src/reports") -> str:
+def create_reports_dir(reports_dir: str = REPORTS_DIR) -> str:
     """Create a directory called "reports" to store the friends bot likelihood report(s).
 
     NOTE: This function is called in `dump_report`.
 
     Args:
         reports_dir (str, optional): The absolute or relative path to the reports
-            directory to be created. Defaults to f"{os.getcwd()}/src/reports".
+            directory to be created. Defaults to REPORTS_DIR (/src/reports).
 
     Returns:
         str: The absolute or relative path to the reports directory.
     """
-    # Check if the reports directory exists, if not create it
-    if not os.path.exists(reports_dir):
+    # Attempt to create the reports directory
+    # Avoids checking if the reports directory exists first
+    try:
+        os.mkdir(reports_dir)
+        loguru.logger.debug("Created reports directory at path: {}", reports_dir)
+    except FileExistsError:
         loguru.logger.debug(
-            f"Reports directory at path: {reports_dir} does not exist. Creating..."
+            "Reports directory at path: {} already exists.", reports_dir
+        )
+    except FileNotFoundError as err:
+        loguru.logger.exception(
+            "Failed to create reports directory at path: {}.\n{}", reports_dir, err
         )
-        try:
-            os.mkdir(reports_dir)
-        except FileNotFoundError as err:
-            loguru.logger.exception(
-                f"Failed to create reports directory at path: {reports_dir}.\n{err}"
-            )
-    else:
-        loguru.logger.debug(f"Reports directory at path: {reports_dir} already exists.")
     return reports_dir
 
 
@@ -269,11 +312,42 @@ def get_demo_friends_bot_likelihood_scores() -> list:
 # Report functions
 
 
+@functools.lru_cache(maxsize=None)
+def get_report_template(template_dir: str) -> jinja2.Template:
+    """Get the compiled friends bot likelihood report template.
+
+    The template is loaded and compiled once per template directory and reused on subsequent calls.
+    The compiled template is also cached to the filesystem (in the system's temporary directory),
+    so it is not recompiled each time the application runs.
+
+    Args:
+        template_dir (str): The directory to look for the report template.
+
+    Returns:
+        jinja2.Template: The compiled report template.
+    """
+    # Create template loader
+    template_loader = jinja2.FileSystemLoader(template_dir)
+    # Create template environment
+    # Disable auto reload as the template does not change while the application is running
+    # Cache the compiled template between runs of the application
+    environment = jinja2.Environment(
+        loader=template_loader,
+        auto_reload=False,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+    )
+    # Add `get_lang_from_code` function to the template environment
+    # So it can be called in the template
+    environment.globals["get_lang_from_code"] = get_lang_from_code
+    # Get the report template
+    return environment.get_template(name="report_template.html")
+
+
 def render_report(
     username: str,
     friends_bot_likelihood_scores: list,
     datetime_str: str,
-    template_dir: str = f"{os.getcwd()}/src/template",
+    template_dir: str = TEMPLATE_DIR,
 ) -> str:
     """Render the friends bot likelihood report from a template using the Jinja2 templating engine.
 
@@ -285,20 +359,13 @@ def render_report(
         username (str): The username of the Twitter account the report has been generated for.
         friends_bot_likelihood_scores (list): A list of bot likelihood scores from the Botometer API for Twitter friends.
         datetime_str (str): A string containing the current date and time (see get_datetime() function).
-        template_dir (str, optional): The directory to look for the report template. Defaults to "{os.getcwd()}/src/template".
+        template_dir (str, optional): The directory to look for the report template. Defaults to TEMPLATE_DIR (/src/template).
 
     Returns:
         str: A unicode formatted string of the rendered report.
     """
-    # Create template loader
-    template_loader = jinja2.FileSystemLoader(template_dir)
-    # Create template environment
-    environment = jinja2.Environment(loader=template_loader)
-    # Add `get_lang_from_code` function to the template environment
-    # So it can be called in the template
-    environment.globals["get_lang_from_code"] = get_lang_from_code
-    # Get the report template
-    report_template = environment.get_template(name="report_template.html")
+    # Get the (cached) report template
+    report_template = get_report_template(template_dir=template_dir)
     # Render report from template
     # Providing data to be used in the template
     loguru.logger.info("Rendering report from template.")
@@ -325,19 +392,88 @@ def dump_report(report_render: str, reports_dir: str, username: str) -> str:
     # Depending on the path provided by the reports_dir parameter
     report_file_path = f"{reports_dir}/@{username}_friends_bot_likelihood_report.html"
     # Dump the report render to a file in the reports directory
+    # Encode the report render once and write the bytes in a single call
+    # Avoids text mode encoding and newline translation
     try:
-        with open(report_file_path, "w") as report_file:
-            report_file.write(report_render)
-        loguru.logger.info(f"Report file created at path: {report_file_path}")
+        with open(report_file_path, "wb") as report_file:
+            report_file.write(report_render.encode("utf-8"))
+        loguru.logger.info("Report file created at path: {}", report_file_path)
         return report_file_path
     except OSError as err:
-        loguru.logger.debug(f"Report render dump:\n{report_render}")
+        loguru.logger.debug("Report render dump:\n{}", report_render)
         loguru.logger.exception(
-            f"Failed to write report render to file at path: {report_file_path}.\n{err}"
+            "Failed to write report render to file at path: {}.\n{}",
+            report_file_path,
+            err,
         )
 
 
-# Email function
+# Email functions
+
+
+@functools.lru_cache(maxsize=None)
+def get_ssl_context() -> ssl.SSLContext:
+    """Get the SSL context used to connect to the email server.
+
+    The context is created once and reused on subsequent calls, so the CA certificates
+    are only loaded once.
+
+    Returns:
+        ssl.SSLContext: A ssl.SSLContext object with the default security settings.
+    """
+    # Create secure SSL context for SMTP connection
+    # Based on best security practice:
+    # https://docs.python.org/3/library/ssl.html#best-defaults
+    return ssl.create_default_context()
+
+
+def connect_email_server(
+    email_server: str,
+    email_server_port: int,
+    email_sender_addr: str,
+    email_sender_pass: str,
+) -> smtplib.SMTP_SSL:
+    """Securely connect and authenticate to the email server.
+
+    Args:
+        email_server (str): The email server to connect to.
+        email_server_port (int): The SSL port the email server is listening on.
+        email_sender_addr (str): The email address of the sender.
+        email_sender_pass (str): The senders email password used to authenticate to the email server.
+
+    Returns:
+        smtplib.SMTP_SSL: A smtplib.SMTP_SSL object connected and authenticated to the email server.
+    """
+    # Initialise connection, so it can be closed if authentication fails
+    smtp_connection = None
+    try:
+        loguru.logger.debug(
+            "Connecting to the email server: {} on port: {}",
+            email_server,
+            email_server_port,
+        )
+        smtp_connection = smtplib.SMTP_SSL(
+            host=email_server,
+            port=email_server_port,
+            timeout=EMAIL_SERVER_TIMEOUT,
+            context=get_ssl_context(),
+        )
+        # Authenticate with the email server
+        loguru.logger.debug("Authenticating to the email server: {}", email_server)
+        smtp_connection.login(user=email_sender_addr, password=email_sender_pass)
+        return smtp_connection
+    # Log any exceptions that can be raised by the `login` method
+    # Terminate the application if one occurs
+    except (smtplib.SMTPAuthenticationError, socket.timeout) as err:
+        # Close the connection before the application terminates
+        if smtp_connection is not None:
+            smtp_connection.close()
+        loguru.logger.exception(
+            "Failed to authenticate to the email server: {} as: {}.\n{}",
+            email_server,
+            email_sender_addr,
+            err,
+        )
 
 
 def send_email_report(
@@ -348,6 +484,8 @@ def send_email_report(
     email_recipient_addr: str,
     report_file_path: str,
     username: str,
+    report_render: str = None,
+    smtp_connection: smtplib.SMTP_SSL = None,
 ) -> None:
     """Send an email with the friends bot likelihood report attached.
 
@@ -359,6 +497,13 @@ def send_email_report(
         email_recipient_addr (str): The recipient email address to send the report to.
         report_file_path (str): The absolute or relative path to the friends bot likelihood report.
         username (str): The username of the Twitter account the report has been generated for.
+        report_render (str, optional): A unicode formatted string of the rendered report.
+            If provided, it is attached to the email instead of reading the report from report_file_path.
+            Defaults to None.
+        smtp_connection (smtplib.SMTP_SSL, optional): A smtplib.SMTP_SSL object already connected and
+            authenticated to the email server (see connect_email_server() function). If not provided,
+            a connection to the email server is created. The connection is closed once the email is sent.
+            Defaults to None.
 
     Returns:
         None.
@@ -367,77 +512,72 @@ def send_email_report(
     email_subject = "Friends Bot Likelihood Report"
     email_body_text = f"""Please see the friends bot likelihood report for @{username} attached to this email.
 Make sure you download the report to preserve its styling, as some email attachment previews can remove it."""
-    # Create email multipart message
-    message = MIMEMultipart()
+    # Create email message
+    message = EmailMessage()
     # Add from, to, and email subject to email message
     message["From"] = email_sender_addr
     message["To"] = email_recipient_addr
     message["Subject"] = email_subject
-    # Attach email body text to the email multipart message
-    message.attach(MIMEText(email_body_text, "plain"))
+    # Set email body text of the email message
+    message.set_content(email_body_text)
 
-    # Open the friends bot likelihood report file to be attached to the email
-    try:
-        with open(report_file_path, "rb") as report_attachment:
-            # Create report_part to include the report as an attachment
-            # Add report as application/octet-stream
-            report_part = MIMEBase("application", "octet-stream")
-            # Set the report_part payload to the byte contents of the report
-            report_part.set_payload(report_attachment.read())
-    except OSError as err:
-        loguru.logger.exception(
-            f"Failed to open report at path: {report_file_path}.\n{err}"
-        )
+    # Get the byte contents of the friends bot likelihood report to be attached to the email
+    if report_render is not None:
+        # Use the report render which has already been dumped to avoid reading the report file
+        report_bytes = report_render.encode("utf-8")
+    else:
+        try:
+            with open(report_file_path, "rb") as report_attachment:
+                report_bytes = report_attachment.read()
+        except OSError as err:
+            loguru.logger.exception(
+                "Failed to open report at path: {}.\n{}", report_file_path, err
+            )
 
-    # Base64 encode report_part to be attached to the email multipart message
-    encoders.encode_base64(report_part)
-    # Add headers to the report_part for the report attachment
-    report_part.add_header(
+    # Attach the report to the email message as application/octet-stream
+    # The report is base64 encoded once when the email message is sent
+    message.add_attachment(
+        report_bytes,
+        maintype="application",
+        subtype="octet-stream",
         # Get report_file_path basename
-        "Content-Disposition",
-        "attachment",
         filename=os.path.basename(fr"{report_file_path}"),
     )
-    # Add report_part containing the report attachment to the email multipart message
-    message.attach(report_part)
-    # Convert email multipart message to a string for sending
-    message_str = message.as_string()
 
-    # Create secure SSL context for SMTP connection
-    # Based on best security practice:
-    # https://docs.python.org/3/library/ssl.html#best-defaults
-    ssl_context = ssl.create_default_context()
+    # Connect to the email server if a connection has not been provided
+    if smtp_connection is None:
+        smtp_connection = connect_email_server(
+            email_server=email_server,
+            email_server_port=email_server_port,
+            email_sender_addr=email_sender_addr,
+            email_sender_pass=email_sender_pass,
+        )
+        # Failed to connect to the email server, an error has been logged
+        if smtp_connection is None:
+            return
 
-    # Use a context manager to securely connect to the email server
+    # Use a context manager to close the connection to the email server once finished
     # Send the email with the report attached
     try:
-        loguru.logger.debug(
-            f"Connecting to the email server: {email_server} on port: {email_server_port}"
-        )
-        with smtplib.SMTP_SSL(
-            host=email_server, port=email_server_port, context=ssl_context
-        ) as smtp_connection:
-            # Authenticate with the email server
-            loguru.logger.debug(f"Authenticating to the email server: {email_server}")
-            smtp_connection.login(user=email_sender_addr, password=email_sender_pass)
-            loguru.logger.debug(f"Sending email to: {email_recipient_addr}")
-            smtp_connection.sendmail(
-                from_addr=email_sender_addr,
-                to_addrs=email_recipient_addr,
-                msg=message_str,
-            )
+        with smtp_connection:
+            loguru.logger.debug("Sending email to: {}", email_recipient_addr)
+            smtp_connection.send_message(msg=message)
             loguru.logger.success(
-                f"Sent email to: {email_recipient_addr} with the friends bot likelihood report attached."
+                "Sent email to: {} with the friends bot likelihood report attached.",
+                email_recipient_addr,
             )
-    # Log any exceptions that can be raised by `login` and `sendmail` methods
+    # Log any exceptions that can be raised by the `send_message` method
     # Terminate the application if one occurs
     except (
-        smtplib.SMTPAuthenticationError,
         smtplib.SMTPRecipientsRefused,
         smtplib.SMTPSenderRefused,
         smtplib.SMTPDataError,
         socket.timeout,
     ) as err:
         loguru.logger.exception(
-            f"Failed to send email from: {email_sender_addr} to: {email_recipient_addr} using the email server: {email_server}.\n{err}"
+            "Failed to send email from: {} to: {} using the email server: {}.\n{}",
+            email_sender_addr,
+            email_recipient_addr,
+            email_server,
+            err,
         )
@@ -3,6 +3,12 @@
 import tweepy
 import requests
 import loguru
+import typing
+
+# HTTP status codes from the Twitter API which are worth retrying a request for
+# Other errors (such as 401 or 404) will not succeed on a retry
+# Rate limit errors (429) are handled separately by waiting for the rate limit to reset
+RETRY_ERRORS = {500, 502, 503, 504}
 
 
 def auth(consumer_key: str, consumer_secret: str) -> tweepy.API:
@@ -24,15 +30,21 @@ def auth(consumer_key: str, consumer_secret: str) -> tweepy.API:
             consumer_key=consumer_key, consumer_secret=consumer_secret
         )
     except requests.exceptions.ConnectionError as err:
-        loguru.logger.exception(f"Failed to authenticate to the Twitter API.\n{err}")
+        loguru.logger.exception("Failed to authenticate to the Twitter API.\n{}", err)
         return
     # Create and return an authenticated Tweepy API object
-    # Retry 2 times if a request fails with a 3 second delay between retries
+    # Retry 2 times if a request fails with a server error with a 3 second delay between retries
     # Wait if the application hits the Twitter API rate limit
-    return tweepy.API(auth, retry_count=2, retry_delay=3, wait_on_rate_limit=True)
+    return tweepy.API(
+        auth,
+        retry_count=2,
+        retry_delay=3,
+        retry_errors=RETRY_ERRORS,
+        wait_on_rate_limit=True,
+    )
 
 
-def get_friends_ids(api: tweepy.API, username: str) -> list:
+def get_friends_ids(api: tweepy.API, username: str) -> typing.Iterator[int]:
     """Get a Twitter user's friends IDs.
 
     https://docs.tweepy.org/en/latest/api.html#tweepy.API.friends_ids
@@ -43,36 +55,48 @@ def get_friends_ids(api: tweepy.API, username: str) -> list:
         api (tweepy.API): A Tweepy API object authenticated to the Twitter API.
         username (str): The username of the Twitter account to collect friends IDs for.
 
-    Returns:
-        list: A list containing all of the specified user's friends. Represented as IDs.
+    Yields:
+        int: Each of the specified user's friends. Represented as IDs.
 
     Notes:
         Using `api.friends_ids` method over `api.friends` because it provides greater API results before hitting the rate limit.
             See: https://github.com/tweepy/tweepy/issues/1431
+        Friends IDs are yielded a page at a time as each page is returned by the Twitter API,
+            so they can be checked with Botometer while the next page is being collected.
+        Each friend ID is only yielded once, so a friend is not checked with Botometer more than once.
     """
-    loguru.logger.info(f"Getting @{username}'s Twitter friends IDs.")
-    # Initialise friends IDs list
-    friends_ids_list = []
+    loguru.logger.info("Getting @{}'s Twitter friends IDs.", username)
+    # Initialise set of friends IDs which have already been yielded
+    # Also used to check if one or more friends IDs were found
+    seen_friends_ids = set()
     # The Twitter API returns results in pages
-    # Use Tweepy's Cursor class to interate over all friends IDs on every page
+    # Use Tweepy's Cursor class to interate over every page of friends IDs
     # Get the maximum number of friends IDs in a single request (5000)
     try:
-        for friend_id in tweepy.Cursor(
+        for friends_ids_page in tweepy.Cursor(
             api.friends_ids, screen_name=username, count=5000
-        ).items():
-            loguru.logger.debug(f"Found friend with ID: {friend_id}")
-            friends_ids_list.append(friend_id)
+        ).pages():
+            # Log once per page instead of once per friend ID
+            loguru.logger.debug("Found page of {} friends IDs.", len(friends_ids_page))
+            # Remove friends IDs which have already been yielded, keeping the order of the page
+            # Pages can overlap if the user follows or unfollows accounts while they are collected
+            new_friends_ids = [
+                friend_id
+                for friend_id in dict.fromkeys(friends_ids_page)
+                if friend_id not in seen_friends_ids
+            ]
+            seen_friends_ids.update(new_friends_ids)
+            yield from new_friends_ids
     except tweepy.TweepError as err:
         loguru.logger.exception(
-            f"Failed to get @{username}'s Twitter friends IDs.\n{err}"
+            "Failed to get @{}'s Twitter friends IDs.\n{}", username, err
         )
-    # Check if the list has one or more results
-    if bool(friends_ids_list):
-        # The list contains at least one or more results
+    # Check if one or more friends IDs were found
+    if seen_friends_ids:
         loguru.logger.debug("One or more friends IDs were found.")
-        return friends_ids_list
     else:
-        # The list contains no results, log a terminating error
+        # No friends IDs were found, log a terminating error
         loguru.logger.exception(
-            f"Failed to get any friends IDs for @{username}. It is likely that the account does not have any friends."
+            "Failed to get any friends IDs for @{}. It is likely that the account does not have any friends.",
+            username,
         )
@@ -0,0 +1,114 @@
+"""Declare fixtures shared by the tests in this directory.
+
+The following fixtures are declared:
+
+1. Credentials for, and authenticated objects of, the Botometer and Twitter APIs.
+        Session scoped, so the application authenticates to each API once per test session.
+
+2. Twitter friend IDs and the current datetime string used in multiple tests.
+"""
+import pytest
+import botometer
+import tweepy
+
+# Local imports
+from modules import botm
+from modules import helpers
+from modules import twitter as twtr
+
+
+@pytest.fixture(scope="session")
+def botometer_creds() -> dict:
+    """Helper fixture to return Botometer API credentials in multiple tests.
+
+    See helpers.get_env_vars() for further details.
+
+    Returns:
+        dict: A dictionary containing the Botometer and Twitter API credentials.
+    """
+    # Get environment variables to authenticate to the Botometer API
+    return helpers.get_env_vars(
+        ["TWITTER_API_KEY", "TWITTER_API_SECRET", "BOTOMETER_API_KEY"]
+    )
+
+
+@pytest.fixture(scope="session")
+def botometer_auth(botometer_creds: dict) -> botometer.Botometer:
+    """Helper fixture to return an authenticated botometer.Botometer object in multiple tests.
+
+    Session scoped, so the application authenticates to the Botometer API once per test session.
+
+    Args:
+        botometer_creds (dict): A dictionary containing the Botometer and Twitter API credentials.
+
+    Returns:
+        botometer.Botometer: A botometer.Botometer object authenticated to the Botometer and Twitter API.
+    """
+    return botm.auth(
+        api_key=botometer_creds["BOTOMETER_API_KEY"],
+        consumer_key=botometer_creds["TWITTER_API_KEY"],
+        consumer_secret=botometer_creds["TWITTER_API_SECRET"],
+    )
+
+
+@pytest.fixture(scope="session")
+def twitter_creds() -> dict:
+    """Helper fixture to return Twitter API credentials in multiple tests.
+
+    See helpers.get_env_vars() for further details.
+
+    Returns:
+        dict: A dictionary containing the Twitter API credentials.
+    """
+    return helpers.get_env_vars(
+        [
+            "TWITTER_API_KEY",
+            "TWITTER_API_SECRET",
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def twitter_auth(twitter_creds: dict) -> tweepy.API:
+    """Helper fixture to return an authenticated tweepy.API object in multiple tests.
+
+    Session scoped, so the application authenticates to the Twitter API once per test session.
+
+    Args:
+        twitter_creds (dict): A dictionary containing the Twitter API credentials.
+
+    Returns:
+        tweepy.API: A Tweepy.API object authenticated to the Twitter API.
+    """
+    # Authenticate to the Twitter API
+    return twtr.auth(
+        consumer_key=twitter_creds["TWITTER_API_KEY"],
+        consumer_secret=twitter_creds["TWITTER_API_SECRET"],
+    )
+
+
+@pytest.fixture(scope="session")
+def friend_ids() -> list:
+    """Helper fixture to return a list of Twitter friend IDs in multiple tests.
+
+    Returns:
+        list: A list containing two Twitter friend IDs.
+    """
+    # @elonmusk and @BBCBreaking
+    return [44196397, 5402612]
+
+
+@pytest.fixture(scope="session")
+def _get_datetime() -> str:
+    """Helper fixture to return the current datetime string.
+
+    See helpers.get_datetime() for further details.
+
+    Session scoped, as the tests only need a datetime string to render the report with.
+
+    Returns:
+        str: A string representing the current datetime.
+            Example return format: "23/04/2021 at 12:00:01".
+    """
+    # Get current datetime string
+    return helpers.get_datetime()
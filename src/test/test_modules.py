@@ -2,13 +2,19 @@
 """
 import pytest
 import pytest_mock
+import loguru
 import os
-import shutil
 import botometer
 import tweepy
 import requests
 import faker
 import datetime
+import pathlib
+import smtplib
+import socket
+import threading
+import time
+import typing
 
 # Local imports
 from modules import botm
@@ -17,12 +23,15 @@ from modules import twitter as twtr
 
 
 # See conftest.py for username and email fixtures
+# See src/test/conftest.py for API credentials, authentication, friend IDs and datetime fixtures
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def friends_bot_likelihood_scores(username: str) -> list:
     """Returns an example JSON response from the Botometer API.
 
+    Session scoped, as the example response is not modified by the tests.
+
     Args:
         username (str): A username provided by the pytest username fixture.
 
@@ -89,120 +98,134 @@ def friends_bot_likelihood_scores(username: str) -> list:
 
 
 @pytest.fixture
-def reports_test_dir(request: pytest.FixtureRequest) -> str:
-    """Returns the relative path to the test reports directory.
+def reports_test_dir(tmp_path: pathlib.Path) -> str:
+    """Returns the path to the test reports directory.
 
-    Also, adds a finaliser function to remove the test reports directory and its contents
-    once the test has completed.
+    The directory is inside the temporary directory pytest creates for each test,
+    so pytest removes it once the test has completed.
 
     Args:
-        request (pytest.FixtureRequest): A pytest fixture providing information of the requesting test function.
+        tmp_path (pathlib.Path): A pytest fixture providing a temporary directory unique to the test.
 
     Returns:
-        str: The relative path to the test reports directory.
+        str: The path to the test reports directory.
     """
-    # Declare relative path to the test reports directory
+    # Declare path to the test reports directory
     # to be created in the relevant tests
-    reports_test_dir_path = "./src/test/reports"
-    # Add finalizer function to remove the test reports directory
-    # and its contents once the test has finished
-    def remove_reports_dir_contents():
-        shutil.rmtree(reports_test_dir_path)
-
-    # Add finalizer function
-    request.addfinalizer(remove_reports_dir_contents)
-    return reports_test_dir_path
+    return str(tmp_path / "reports")
 
 
 @pytest.fixture
-def botometer_creds() -> dict:
-    """Helper fixture to return Botometer API credentials in multiple tests.
-
-    See helpers.get_env_vars() for further details.
+def mock_botometer_auth(mocker: pytest_mock.MockerFixture) -> botometer.Botometer:
+    """Helper fixture to return a mock botometer.Botometer object in multiple tests.
 
-    Returns:
-        dict: A dictionary containing the Botometer and Twitter API credentials.
-    """
-    # Get environment variables to authenticate to the Botometer API
-    return helpers.get_env_vars(
-        ["TWITTER_API_KEY", "TWITTER_API_SECRET", "BOTOMETER_API_KEY"]
-    )
-
-
-@pytest.fixture
-def botometer_auth(botometer_creds: dict) -> botometer.Botometer:
-    """Helper fixture to return an authenticated botometer.Botometer object in multiple tests.
+    Used by tests which patch the Botometer API responses, so they do not need to
+    authenticate to the Botometer and Twitter APIs.
 
     Args:
-        botometer_creds (dict): A dictionary containing the Botometer and Twitter API credentials.
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
 
     Returns:
-        botometer.Botometer: A botometer.Botometer object authenticated to the Botometer and Twitter API.
+        botometer.Botometer: A mock botometer.Botometer object with the same attributes and methods.
     """
-    return botm.auth(
-        api_key=botometer_creds["BOTOMETER_API_KEY"],
-        consumer_key=botometer_creds["TWITTER_API_KEY"],
-        consumer_secret=botometer_creds["TWITTER_API_SECRET"],
-    )
+    return mocker.create_autospec(botometer.Botometer, instance=True)
 
 
-@pytest.fixture
-def twitter_creds() -> dict:
-    """Helper fixture to return Twitter API credentials in multiple tests.
+@pytest.fixture(scope="module")
+def botometer_friends_bot_likelihood_scores(
+    botometer_auth: botometer.Botometer, friend_ids: list
+) -> list:
+    """Helper fixture to return the bot likelihood scores from the Botometer API in multiple tests.
+
+    Module scoped, so the friend IDs are only checked with the Botometer API once.
 
-    See helpers.get_env_vars() for further details.
+    Args:
+        botometer_auth (botometer.Botometer): A botometer.Botometer object authenticated to the Botometer and Twitter API.
+        friend_ids (list): A list containing two Twitter friend IDs.
 
     Returns:
-        dict: A dictionary containing the Twitter API credentials.
+        list: A list containing the bot likelihood scores for each Twitter friend.
     """
-    return helpers.get_env_vars(
-        [
-            "TWITTER_API_KEY",
-            "TWITTER_API_SECRET",
-        ]
+    return botm.get_friends_bot_likelihood_scores(
+        api=botometer_auth, friends=friend_ids
     )
 
 
 @pytest.fixture
-def twitter_auth(twitter_creds: dict) -> tweepy.API:
-    """Helper fixture to return an authenticated tweepy.API object in multiple tests.
+def report_file_path(
+    reports_test_dir: str,
+    username: str,
+    friends_bot_likelihood_scores: list,
+    _get_datetime: str,
+) -> str:
+    """Helper fixture to return the path to a dumped friends bot likelihood report in multiple tests.
+
+    See helpers.create_reports_dir(), helpers.render_report() and helpers.dump_report() for further details.
 
     Args:
-        twitter_creds (dict): A dictionary containing the Twitter API credentials.
+        reports_test_dir (str): The path to the test reports directory.
+        username (str): A username provided by the pytest username fixture.
+        friends_bot_likelihood_scores (list): A list containing the bot likelihood scores for each Twitter friend.
+        _get_datetime (str): A string representing the current datetime.
 
     Returns:
-        tweepy.API: A Tweepy.API object authenticated to the Twitter API.
+        str: The path to the friends bot likelihood report.
     """
-    # Authenticate to the Twitter API
-    return twtr.auth(
-        consumer_key=twitter_creds["TWITTER_API_KEY"],
-        consumer_secret=twitter_creds["TWITTER_API_SECRET"],
+    # Create test reports directory
+    reports_dir = helpers.create_reports_dir(reports_dir=reports_test_dir)
+    # Render the friends bot likelihood report from the template
+    report_render = helpers.render_report(
+        username=username,
+        friends_bot_likelihood_scores=friends_bot_likelihood_scores,
+        datetime_str=_get_datetime,
+    )
+    # Dump report render to a file in the test reports directory
+    return helpers.dump_report(
+        report_render=report_render, reports_dir=reports_dir, username=username
     )
 
 
-@pytest.fixture
-def friend_ids() -> list:
-    """Helper fixture to return a list of Twitter friend IDs in multiple tests.
-
-    Returns:
-        list: A list containing two Twitter friend IDs.
-    """
-    # @elonmusk and @BBCBreaking
-    return [44196397, 5402612]
-
-
-@pytest.fixture
-def _get_datetime() -> str:
-    """Helper fixture to return the current datetime string.
-
-    See helpers.get_datetime() for further details.
+@pytest.mark.parametrize(
+    "level, terminates",
+    [
+        ("WARNING", False),
+        ("ERROR", True),
+        ("CRITICAL", True),
+    ],
+)
+@pytest.mark.utility
+def test_terminate_application(
+    mocker: pytest_mock.MockerFixture, level: str, terminates: bool
+) -> None:
+    """Test the log handler configured by helpers.init_log_handler() terminates the application
+        with exit code 1 for "ERROR" and higher log messages only.
 
-    Returns:
-        str: A string representing the current datetime.
-            Example return format: "23/04/2021 at 12:00:01".
+    Args:
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
+        level (str): The level of the log message to emit.
+        terminates (bool): Whether the log message is expected to terminate the application.
     """
-    # Get current datetime string
-    return helpers.get_datetime()
+    # Patch loguru's configure method to get the log handler configurations
+    # instead of replacing the log handlers used by pytest
+    mock_configure = mocker.patch("modules.helpers.loguru.logger.configure")
+    helpers.init_log_handler()
+    terminate_handler_config = next(
+        handler_config
+        for handler_config in mock_configure.call_args.kwargs["handlers"]
+        if handler_config["sink"] == helpers.terminate_application
+    )
+    handler_id = loguru.logger.add(**terminate_handler_config)
+    try:
+        if terminates:
+            with pytest.raises(SystemExit) as exit_info:
+                loguru.logger.log(level, "Test log message.")
+            assert exit_info.value.code == 1
+        else:
+            loguru.logger.log(level, "Test log message.")
+    finally:
+        loguru.logger.remove(handler_id)
 
 
 class TestGetEnvVars:
@@ -212,7 +235,9 @@ class TestGetEnvVars:
     env_var_names = ["TWITTER_API_KEY", "TWITTER_API_SECRET", "BOTOMETER_API_KEY"]
 
     @pytest.fixture(autouse=True)
-    def mock_os_environ(self, mocker: pytest_mock.MockerFixture) -> None:
+    def mock_os_environ(
+        self, mocker: pytest_mock.MockerFixture
+    ) -> typing.Iterator[None]:
         """Mocker fixture to run for every test inside the class.
 
         Args:
@@ -228,25 +253,46 @@ class TestGetEnvVars:
                 BOTOMETER_API_KEY="API key",
             ),
         )
-
-    @pytest.mark.utility
-    def test_get_env_vars_type(self) -> None:
-        """Test the return value type from helpers.get_env_vars()."""
-        # Get environment variables
-        env_vars_dict = helpers.get_env_vars(self.env_var_names)
-        # Check env_vars_dict is a dictionary
-        assert type(env_vars_dict) == dict
+        # Clear the environment variables cache before and after each test
+        # So the mocked environment variables are read and not cached for other tests
+        helpers.clear_env_vars_cache()
+        yield
+        helpers.clear_env_vars_cache()
 
     @pytest.mark.utility
     def test_get_env_vars(self) -> None:
-        """Test the expected dictionary keys and values are returned from helpers.get_env_vars()."""
+        """Test a dictionary with the expected keys and values is returned from helpers.get_env_vars()."""
         # Get environment variables
         env_vars = helpers.get_env_vars(self.env_var_names)
-        # Check env_vars contains the mocked dict key value pairs
-        assert env_vars == dict(
-            TWITTER_API_KEY="API key",
-            TWITTER_API_SECRET="API secret",
-            BOTOMETER_API_KEY="API key",
+        # Check env_vars is a dictionary and contains the mocked dict key value pairs
+        assert (type(env_vars) == dict) and (
+            env_vars
+            == dict(
+                TWITTER_API_KEY="API key",
+                TWITTER_API_SECRET="API secret",
+                BOTOMETER_API_KEY="API key",
+            )
+        )
+
+    @pytest.mark.utility
+    def test_get_env_vars_cache(self, mocker: pytest_mock.MockerFixture) -> None:
+        """Test helpers.get_env_vars() returns cached values until the cache is cleared.
+
+        Args:
+            mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+                thin-wrapper around the patching API from the mock library.
+        """
+        # Get environment variables, caching them
+        helpers.get_env_vars(self.env_var_names)
+        # Change an environment variable and check the cached value is returned
+        mocker.patch.dict("os.environ", dict(TWITTER_API_KEY="New API key"))
+        assert helpers.get_env_vars(["TWITTER_API_KEY"]) == dict(
+            TWITTER_API_KEY="API key"
+        )
+        # Clear the cache and check the new value is returned
+        helpers.clear_env_vars_cache()
+        assert helpers.get_env_vars(["TWITTER_API_KEY"]) == dict(
+            TWITTER_API_KEY="New API key"
         )
 
     @pytest.mark.utility
@@ -289,6 +335,9 @@ def test_get_datetime(mocker: pytest_mock.MockerFixture) -> None:
         ("en", "English"),
         ("de", "German"),
         ("fr", "French"),
+        # Test language codes are matched case-insensitively
+        ("EN", "English"),
+        ("De", "German"),
         # Test "Unknown" is returned when a language code not in
         # ISO 639-1 format is provided
         ("", "Unknown"),
@@ -315,7 +364,7 @@ def test_create_reports_dir(reports_test_dir: str) -> None:
     """Test helpers.create_reports_dir() creates the test reports directory.
 
     Args:
-        reports_test_dir (str): The relative path to the test reports directory.
+        reports_test_dir (str): The path to the test reports directory.
     """
     # Create test reports directory
     reports_dir = helpers.create_reports_dir(reports_dir=reports_test_dir)
@@ -330,7 +379,7 @@ def test_create_reports_dir_already_exists(reports_test_dir: str, caplog) -> Non
         if it already exists.
 
     Args:
-        reports_test_dir (str): The relative path to the test reports directory.
+        reports_test_dir (str): The path to the test reports directory.
         caplog: A pytest caplog fixture used to examine application log messages.
     """
     # Create the test reports directory
@@ -393,29 +442,11 @@ def test_get_username(mocker: pytest_mock.MockerFixture, faker: faker.Faker) ->
     assert spy_get_username.call_count == 5
 
 
-@pytest.mark.utility
-@pytest.mark.demo
-def test_get_scores_len_type(faker: faker.Faker) -> None:
-    """Test helpers.get_scores() returns a list of the expected length
-    and all items in the list are integers.
-
-    Args:
-        faker: A faker fixture for pytest.
-    """
-    # Get 7 random scores
-    scores = helpers.get_scores(api=faker)
-    # Test returned type, length and all items in the list are integers
-    assert (
-        (type(scores) == list)
-        and (all(isinstance(score, float) for score in scores))
-        and (len(scores) == 7)
-    )
-
-
 @pytest.mark.utility
 @pytest.mark.demo
 def test_get_scores(faker: faker.Faker) -> None:
-    """Test helpers.get_scores() returns the expected scores when seeded.
+    """Test helpers.get_scores() returns a list of the expected length
+    and the expected scores when seeded.
 
     Args:
         faker: A faker fixture for pytest.
@@ -423,10 +454,13 @@ def test_get_scores(faker: faker.Faker) -> None:
     expected_scores = [3.8, 1.2, 3.9, 2.2, 1.1, 3.8, 3.9]
     # Seed faker for this test
     faker.seed_instance(2468)
-    # Get 7 scores and check they are expected from the seed value
+    # Get 7 scores
     scores = helpers.get_scores(api=faker)
+    # Test returned type and length
+    assert (type(scores) == list) and (len(scores) == 7)
+    # Check all items in the list are floats and expected from the seed value
     for score in scores:
-        assert score in expected_scores
+        assert isinstance(score, float) and (score in expected_scores)
 
 
 @pytest.mark.utility
@@ -486,6 +520,7 @@ def test_botometer_auth_conn_err(mocker: pytest_mock.MockerFixture, caplog) -> N
 
 
 @pytest.mark.botometer
+@pytest.mark.integration
 def test_botometer_auth_type(botometer_auth: botometer.Botometer) -> None:
     """Test botm.auth() (invoked in the botometer_auth fixture)
         returns an instance of botometer.Botometer.
@@ -497,39 +532,36 @@ def test_botometer_auth_type(botometer_auth: botometer.Botometer) -> None:
 
 
 @pytest.mark.botometer
+@pytest.mark.integration
 def test_get_friends_bot_likelihood_scores_len_type(
-    botometer_auth: botometer.Botometer, friend_ids: list
+    botometer_friends_bot_likelihood_scores: list,
 ) -> None:
     """Test botm.get_friends_bot_likelihood_scores() returns a list of the expected length.
 
     Args:
-        botometer_auth (botometer.Botometer): A botometer.Botometer object authenticated to the Botometer and Twitter API.
-        friend_ids (list): A list containing two Twitter friend IDs.
+        botometer_friends_bot_likelihood_scores (list): The bot likelihood scores returned by
+            botm.get_friends_bot_likelihood_scores() for each Twitter friend.
     """
-    friends_bot_likelihood_scores = botm.get_friends_bot_likelihood_scores(
-        api=botometer_auth, friends=friend_ids
-    )
     # Test returned list length and type
-    assert (type(friends_bot_likelihood_scores) == list) and (
-        len(friends_bot_likelihood_scores) == 2
+    assert (type(botometer_friends_bot_likelihood_scores) == list) and (
+        len(botometer_friends_bot_likelihood_scores) == 2
     )
 
 
 @pytest.mark.botometer
+@pytest.mark.integration
 def test_get_friends_bot_likelihood_scores_results(
-    botometer_auth: botometer.Botometer, friend_ids: list
+    botometer_friends_bot_likelihood_scores: list, friend_ids: list
 ) -> None:
     """Test botm.get_friends_bot_likelihood_scores() returns the expected
         JSON results from the Botometer API for each friend ID provided.
 
     Args:
-        botometer_auth (botometer.Botometer): A botometer.Botometer object authenticated to the Botometer and Twitter API.
+        botometer_friends_bot_likelihood_scores (list): The bot likelihood scores returned by
+            botm.get_friends_bot_likelihood_scores() for each Twitter friend.
         friend_ids (list): A list containing two Twitter friend IDs.
     """
-    friends_bot_likelihood_scores = botm.get_friends_bot_likelihood_scores(
-        api=botometer_auth, friends=friend_ids
-    )
-    for friend_scores in friends_bot_likelihood_scores:
+    for friend_scores in botometer_friends_bot_likelihood_scores:
         # Check the data used is present in the Botometer API response
         assert friend_scores["display_scores"]["english"]
         assert friend_scores["display_scores"]["universal"]
@@ -538,6 +570,7 @@ def test_get_friends_bot_likelihood_scores_results(
 
 
 @pytest.mark.botometer
+@pytest.mark.integration
 def test_get_friends_bot_likelihood_scores_err(
     botometer_auth: botometer.Botometer, caplog
 ) -> None:
@@ -556,26 +589,20 @@ def test_get_friends_bot_likelihood_scores_err(
 
 @pytest.mark.botometer
 def test_get_friends_bot_likelihood_scores_conn_err(
-    botometer_auth: botometer.Botometer,
+    mock_botometer_auth: botometer.Botometer,
     friend_ids: list,
-    mocker: pytest_mock.MockerFixture,
     caplog,
 ) -> None:
     """Test botm.get_friends_bot_likelihood_scores() logs an error when a ConnectionError occurs.
 
     Args:
-        botometer_auth (botometer.Botometer): A botometer.Botometer object authenticated to the Botometer and Twitter API.
+        mock_botometer_auth (botometer.Botometer): A mock botometer.Botometer object.
         friend_ids (list): A list containing two Twitter friend IDs.
-        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
-            thin-wrapper around the patching API from the mock library.
         caplog: A pytest caplog fixture used to examine application log messages.
     """
-    # Patch botometer.Botometer.check_accounts_in method to raise a ConnectionError
-    mocker.patch(
-        "modules.botm.botometer.Botometer.check_accounts_in",
-        side_effect=botometer.ConnectionError(),
-    )
-    botm.get_friends_bot_likelihood_scores(api=botometer_auth, friends=friend_ids)
+    # Make the mock botometer.Botometer.check_accounts_in method raise a ConnectionError
+    mock_botometer_auth.check_accounts_in.side_effect = botometer.ConnectionError()
+    botm.get_friends_bot_likelihood_scores(api=mock_botometer_auth, friends=friend_ids)
     # Verify that an exception occurred in the logs
     assert (
         "An exception occurred and all retries to Botometer have been exhausted."
@@ -585,26 +612,20 @@ def test_get_friends_bot_likelihood_scores_conn_err(
 
 @pytest.mark.botometer
 def test_get_friends_bot_likelihood_scores_http_err(
-    botometer_auth: botometer.Botometer,
+    mock_botometer_auth: botometer.Botometer,
     friend_ids: list,
-    mocker: pytest_mock.MockerFixture,
     caplog,
 ) -> None:
     """Test botm.get_friends_bot_likelihood_scores() logs an error when a HTTPError occurs.
 
     Args:
-        botometer_auth (botometer.Botometer): A botometer.Botometer object authenticated to the Botometer and Twitter API.
+        mock_botometer_auth (botometer.Botometer): A mock botometer.Botometer object.
         friend_ids (list): A list containing two Twitter friend IDs.
-        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
-            thin-wrapper around the patching API from the mock library.
         caplog: A pytest caplog fixture used to examine application log messages.
     """
-    # Patch botometer.Botometer.check_accounts_in method to raise a HTTPError
-    mocker.patch(
-        "modules.botm.botometer.Botometer.check_accounts_in",
-        side_effect=botometer.HTTPError(),
-    )
-    botm.get_friends_bot_likelihood_scores(api=botometer_auth, friends=friend_ids)
+    # Make the mock botometer.Botometer.check_accounts_in method raise a HTTPError
+    mock_botometer_auth.check_accounts_in.side_effect = botometer.HTTPError()
+    botm.get_friends_bot_likelihood_scores(api=mock_botometer_auth, friends=friend_ids)
     # Verify that an exception occurred in the logs
     assert (
         "An exception occurred and all retries to Botometer have been exhausted."
@@ -614,26 +635,20 @@ def test_get_friends_bot_likelihood_scores_http_err(
 
 @pytest.mark.botometer
 def test_get_friends_bot_likelihood_scores_timeout_err(
-    botometer_auth: botometer.Botometer,
+    mock_botometer_auth: botometer.Botometer,
     friend_ids: list,
-    mocker: pytest_mock.MockerFixture,
     caplog,
 ) -> None:
     """Test botm.get_friends_bot_likelihood_scores() logs an error when a Timeout occurs.
 
     Args:
-        botometer_auth (botometer.Botometer): A botometer.Botometer object authenticated to the Botometer and Twitter API.
+        mock_botometer_auth (botometer.Botometer): A mock botometer.Botometer object.
         friend_ids (list): A list containing two Twitter friend IDs.
-        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
-            thin-wrapper around the patching API from the mock library.
         caplog: A pytest caplog fixture used to examine application log messages.
     """
-    # Patch botometer.Botometer.check_accounts_in method to raise a Timeout error
-    mocker.patch(
-        "modules.botm.botometer.Botometer.check_accounts_in",
-        side_effect=botometer.Timeout(),
-    )
-    botm.get_friends_bot_likelihood_scores(api=botometer_auth, friends=friend_ids)
+    # Make the mock botometer.Botometer.check_accounts_in method raise a Timeout error
+    mock_botometer_auth.check_accounts_in.side_effect = botometer.Timeout()
+    botm.get_friends_bot_likelihood_scores(api=mock_botometer_auth, friends=friend_ids)
     # Verify that an exception occurred in the logs
     assert (
         "An exception occurred and all retries to Botometer have been exhausted."
@@ -641,214 +656,382 @@ def test_get_friends_bot_likelihood_scores_timeout_err(
     )
 
 
-@pytest.mark.twitter
-def test_twitter_auth_conn_err(mocker: pytest_mock.MockerFixture, caplog) -> None:
-    """Test an error is logged when a ConnectionError occurs in twtr.auth().
+@pytest.mark.botometer
+def test_get_friends_bot_likelihood_scores_mocked(
+    mocker: pytest_mock.MockerFixture,
+    mock_botometer_auth: botometer.Botometer,
+    caplog,
+) -> None:
+    """Test botm.get_friends_bot_likelihood_scores() returns the results in the order of the friends provided,
+        skips error results, logs results in batches and returns the results collected before an exception occurs.
 
     Args:
         mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
             thin-wrapper around the patching API from the mock library.
+        mock_botometer_auth (botometer.Botometer): A mock botometer.Botometer object.
         caplog: A pytest caplog fixture used to examine application log messages.
     """
-    # Patch tweepy.AppAuthHandler class to raise a ConnectionError
-    mocker.patch(
-        "modules.twitter.tweepy.AppAuthHandler",
-        side_effect=requests.exceptions.ConnectionError(),
+
+    def check_accounts_in(accounts, full_user_object, retries):
+        for account in accounts:
+            # Check later friends faster, so results are not returned in the order of the friends provided
+            time.sleep(0.01 * (6 - account))
+            # Friend 3 returns an error result and friend 5 raises an exception
+            if account == 3:
+                yield account, {"error": "NoTimelineError: "}
+            elif account == 5:
+                raise botometer.ConnectionError()
+            else:
+                yield account, {
+                    "cap": {},
+                    "raw_scores": {},
+                    "user": {"user_data": {"screen_name": f"friend{account}"}},
+                }
+
+    # Log results in batches of 2 friends
+    mocker.patch.object(botm, "LOG_BATCH_SIZE", 2)
+    mock_botometer_auth.check_accounts_in.side_effect = check_accounts_in
+    friends_bot_likelihood_scores = botm.get_friends_bot_likelihood_scores(
+        api=mock_botometer_auth, friends=[1, 2, 3, 4, 5, 6]
+    )
+    # Check the results collected before the exception are returned in order
+    # without the error result, cap and raw_scores keys
+    assert friends_bot_likelihood_scores == [
+        {"user": {"user_data": {"screen_name": f"friend{account}"}}}
+        for account in [1, 2, 4]
+    ]
+    # Check the results and errors are logged in batches
+    assert (
+        "Got bot likelihood results from Botometer for 2 friends: [('friend1', 1), ('friend2', 2)]"
+        in caplog.text
+    )
+    assert (
+        "Got bot likelihood results from Botometer for 1 friends: [('friend4', 4)]"
+        in caplog.text
+    )
+    assert (
+        "Botometer returned errors for 1 friends: [(3, 'NoTimelineError: ')]"
+        in caplog.text
+    )
+    assert (
+        "An exception occurred and all retries to Botometer have been exhausted."
+        in caplog.text
     )
-    twtr.auth(consumer_key="API key", consumer_secret="API secret")
-    # Verify that an exception occurred in the logs
-    assert "Failed to authenticate to the Twitter API." in caplog.text
 
 
-@pytest.mark.twitter
-def test_twitter_auth_type(twitter_auth: tweepy.API) -> None:
-    """Test twtr.auth() (invoked in the twitter_auth fixture)
-        returns an instance of tweepy.API.
+@pytest.mark.parametrize("friends_count", [2, 20])
+@pytest.mark.botometer
+def test_get_friends_bot_likelihood_scores_generators(
+    mock_botometer_auth: botometer.Botometer, friends_count: int
+) -> None:
+    """Test botm.get_friends_bot_likelihood_scores() starts at most one `check_accounts_in` generator
+        per thread which checks a friend.
 
     Args:
-        twitter_auth (tweepy.API): A Tweepy.API object authenticated to the Twitter API.
+        mock_botometer_auth (botometer.Botometer): A mock botometer.Botometer object.
+        friends_count (int): The number of friends to check.
     """
-    assert isinstance(twitter_auth, tweepy.API)
-
 
-@pytest.mark.twitter
-def test_get_friends_ids_len_types(twitter_auth: tweepy.API, username: str) -> None:
-    """Test twtr.get_friends_ids() returns a list of the expected length and that all values
-        in the list are integers.
+    def check_accounts_in(accounts, full_user_object, retries):
+        for account in accounts:
+            yield account, {"user": {"user_data": {"screen_name": f"friend{account}"}}}
 
-    Args:
-        twitter_auth (tweepy.API): A Tweepy.API object authenticated to the Twitter API.
-        username (str): A username provided by the pytest username fixture.
-    """
-    friend_ids_list = twtr.get_friends_ids(api=twitter_auth, username=username)
-    # Test returned list length
-    # and all items in the list are integers
-    assert (type(friend_ids_list) == list) and (
-        all(isinstance(friend_id, int) for friend_id in friend_ids_list)
+    mock_botometer_auth.check_accounts_in.side_effect = check_accounts_in
+    friends = list(range(friends_count))
+    friends_bot_likelihood_scores = botm.get_friends_bot_likelihood_scores(
+        api=mock_botometer_auth, friends=friends
+    )
+    # Check every friend has a result, in order
+    assert [
+        friend_scores["user"]["user_data"]["screen_name"]
+        for friend_scores in friends_bot_likelihood_scores
+    ] == [f"friend{friend_id}" for friend_id in friends]
+    # Check a generator was not started for each friend
+    assert (
+        1
+        <= mock_botometer_auth.check_accounts_in.call_count
+        <= min(friends_count, botm.MAX_WORKERS)
     )
 
 
-@pytest.mark.twitter
-def test_get_friends_ids_err_username(twitter_auth: tweepy.API, caplog) -> None:
-    """Test twtr.get_friends_ids() logs an error when provided an invalid username to get Twitter
-        friend IDs for.
+@pytest.mark.botometer
+def test_get_friends_bot_likelihood_scores_early_err(
+    mock_botometer_auth: botometer.Botometer, caplog
+) -> None:
+    """Test botm.get_friends_bot_likelihood_scores() stops taking friends from the iterable
+        once an exception occurs, without waiting for every friend to be provided.
 
     Args:
-        twitter_auth (tweepy.API): A Tweepy.API object authenticated to the Twitter API.
+        mock_botometer_auth (botometer.Botometer): A mock botometer.Botometer object.
         caplog: A pytest caplog fixture used to examine application log messages.
     """
-    # Declare an invalid username
-    invalid_username = "This is not a valid username"
-    twtr.get_friends_ids(api=twitter_auth, username=invalid_username)
-    # Verify that an exception occurred in the logs
-    assert f"Failed to get @{invalid_username}'s Twitter friends IDs." in caplog.text
+    # Record the friends taken from the iterable
+    friends_taken = []
+
+    def friends():
+        for friend_id in range(50):
+            friends_taken.append(friend_id)
+            yield friend_id
+            # Wait before providing the next friend, like a page of friends IDs being collected
+            time.sleep(0.05)
+
+    # Make the mock botometer.Botometer.check_accounts_in method raise a ConnectionError
+    mock_botometer_auth.check_accounts_in.side_effect = botometer.ConnectionError()
+    botm.get_friends_bot_likelihood_scores(api=mock_botometer_auth, friends=friends())
+    assert (
+        "An exception occurred and all retries to Botometer have been exhausted."
+        in caplog.text
+    )
+    assert len(friends_taken) < 50
 
 
-@pytest.mark.twitter
-def test_get_friends_ids_err_no_friends(twitter_auth: tweepy.API, caplog) -> None:
-    """Test twtr.get_friends_ids() logs an error when provided a Twitter user that is not following anyone (has no friends).
+@pytest.mark.botometer
+def test_get_friends_bot_likelihood_scores_no_wait(
+    mock_botometer_auth: botometer.Botometer, caplog
+) -> None:
+    """Test botm.get_friends_bot_likelihood_scores() returns without waiting for a friend still being checked
+        when an exception occurs, and the friend is checked by a daemon thread.
 
     Args:
-        twitter_auth (tweepy.API): A Tweepy.API object authenticated to the Twitter API.
+        mock_botometer_auth (botometer.Botometer): A mock botometer.Botometer object.
         caplog: A pytest caplog fixture used to examine application log messages.
     """
-    # A Twitter bot that has no friends
-    username = "ProgressYearBar"
-    twtr.get_friends_ids(api=twitter_auth, username=username)
-    # Verify that an exception occurred in the logs
+    # Events to wait for friend 2 to be checked and to release it once the test has finished
+    checking = threading.Event()
+    release = threading.Event()
+    # Record whether the thread checking friend 2 is a daemon thread
+    daemon_threads = []
+
+    def check_accounts_in(accounts, full_user_object, retries):
+        for account in accounts:
+            # Friend 1 raises an exception once friend 2 is being checked
+            # Friend 2 is checked until the test has finished
+            if account == 1:
+                checking.wait(timeout=5)
+                raise botometer.ConnectionError()
+            daemon_threads.append(threading.current_thread().daemon)
+            checking.set()
+            release.wait(timeout=5)
+            yield account, {"user": {"user_data": {"screen_name": f"friend{account}"}}}
+
+    mock_botometer_auth.check_accounts_in.side_effect = check_accounts_in
+    start = time.monotonic()
+    try:
+        botm.get_friends_bot_likelihood_scores(api=mock_botometer_auth, friends=[1, 2])
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
     assert (
-        f"Failed to get any friends IDs for @{username}. It is likely that the account does not have any friends."
+        "An exception occurred and all retries to Botometer have been exhausted."
         in caplog.text
     )
+    assert elapsed < 1
+    assert daemon_threads == [True]
 
 
-# Cannot parameterize these tests due to: https://github.com/pytest-dev/pytest/issues/349
+@pytest.mark.twitter
+def test_twitter_auth(mocker: pytest_mock.MockerFixture) -> None:
+    """Test twtr.auth() is invoked with the correct parameters.
 
+    Args:
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
+    """
+    mock_tweepy = mocker.patch("modules.twitter.tweepy")
+    # Create a mock version of tweepy.API
+    twtr.auth(consumer_key="API key", consumer_secret="API secret")
+    # Validate that the mock version of tweepy.API was invoked with the correct
+    # parameters
+    mock_tweepy.API.assert_called_with(
+        mock_tweepy.AppAuthHandler.return_value,
+        retry_count=2,
+        retry_delay=3,
+        retry_errors={500, 502, 503, 504},
+        wait_on_rate_limit=True,
+    )
 
-@pytest.mark.report
-def test_render_report(
-    username: str, friends_bot_likelihood_scores: list, _get_datetime: str
-) -> None:
-    """Test helpers.render_report() returns a string when provided all parameters.
+
+@pytest.mark.twitter
+def test_twitter_auth_conn_err(mocker: pytest_mock.MockerFixture, caplog) -> None:
+    """Test an error is logged when a ConnectionError occurs in twtr.auth().
 
     Args:
-        username (str): A username provided by the pytest username fixture.
-        friends_bot_likelihood_scores (list): A list containing the bot likelihood scores for each Twitter friend.
-        _get_datetime (str): A string representing the current datetime.
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
+        caplog: A pytest caplog fixture used to examine application log messages.
     """
-    assert (
-        type(
-            helpers.render_report(
-                username=username,
-                friends_bot_likelihood_scores=friends_bot_likelihood_scores,
-                datetime_str=_get_datetime,
-            )
-        )
-        == str
+    # Patch tweepy.AppAuthHandler class to raise a ConnectionError
+    mocker.patch(
+        "modules.twitter.tweepy.AppAuthHandler",
+        side_effect=requests.exceptions.ConnectionError(),
     )
+    twtr.auth(consumer_key="API key", consumer_secret="API secret")
+    # Verify that an exception occurred in the logs
+    assert "Failed to authenticate to the Twitter API." in caplog.text
 
 
-@pytest.mark.report
-def test_render_report_no_username(
-    friends_bot_likelihood_scores: list, _get_datetime: str
+@pytest.mark.twitter
+@pytest.mark.integration
+def test_twitter_auth_type(twitter_auth: tweepy.API) -> None:
+    """Test twtr.auth() (invoked in the twitter_auth fixture)
+        returns an instance of tweepy.API.
+
+    Args:
+        twitter_auth (tweepy.API): A Tweepy.API object authenticated to the Twitter API.
+    """
+    assert isinstance(twitter_auth, tweepy.API)
+
+
+@pytest.mark.twitter
+def test_get_friends_ids_len_types(
+    mocker: pytest_mock.MockerFixture, friend_ids: list, username: str
 ) -> None:
-    """Test helpers.render_report() returns a string when the username parameter is empty string.
+    """Test twtr.get_friends_ids() yields friend IDs which are all integers.
 
     Args:
-        friends_bot_likelihood_scores (list): A list containing the bot likelihood scores for each Twitter friend.
-        _get_datetime (str): A string representing the current datetime.
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
+        friend_ids (list): A list containing two Twitter friend IDs.
+        username (str): A username provided by the pytest username fixture.
     """
-    assert (
-        type(
-            helpers.render_report(
-                username="",
-                friends_bot_likelihood_scores=friends_bot_likelihood_scores,
-                datetime_str=_get_datetime,
-            )
+    # Patch tweepy.Cursor class to return the friend IDs over two pages
+    # instead of requesting them from the Twitter API
+    mock_cursor = mocker.patch("modules.twitter.tweepy.Cursor")
+    mock_cursor.return_value.pages.return_value = [
+        [friend_id] for friend_id in friend_ids
+    ]
+    friend_ids_list = list(
+        twtr.get_friends_ids(
+            api=mocker.create_autospec(tweepy.API, instance=True), username=username
         )
-        == str
+    )
+    # Test returned list, the friend IDs from every page
+    # and all items in the list are integers
+    assert (
+        (type(friend_ids_list) == list)
+        and (friend_ids_list == friend_ids)
+        and (all(isinstance(friend_id, int) for friend_id in friend_ids_list))
     )
 
 
-@pytest.mark.report
-def test_render_report_no_scores(username: str, _get_datetime: str) -> None:
-    """Test helpers.render_report() returns a string when the
-        friends_bot_likelihood_scores parameter is an empty dictionary.
+@pytest.mark.twitter
+def test_get_friends_ids_duplicates(mocker: pytest_mock.MockerFixture) -> None:
+    """Test twtr.get_friends_ids() yields each friend ID once, in the order it is first found.
 
     Args:
-        username (str): A username provided by the pytest username fixture.
-        _get_datetime (str): A string representing the current datetime.
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
     """
-    assert (
-        type(
-            helpers.render_report(
-                username=username,
-                friends_bot_likelihood_scores={},
-                datetime_str=_get_datetime,
-            )
+    # Patch tweepy.Cursor class to return overlapping pages of friend IDs
+    # The second page repeats a friend ID from the first page and repeats a friend ID within the page
+    mock_cursor = mocker.patch("modules.twitter.tweepy.Cursor")
+    mock_cursor.return_value.pages.return_value = [[3, 1, 2], [2, 4, 4, 5], [5, 6]]
+    friend_ids_list = list(
+        twtr.get_friends_ids(
+            api=mocker.create_autospec(tweepy.API, instance=True),
+            username="ProgressYearBar",
         )
-        == str
     )
+    # Test each friend ID is yielded exactly once, in the order it is first found
+    assert friend_ids_list == [3, 1, 2, 4, 5, 6]
 
 
-@pytest.mark.report
-def test_render_report_no_datetime(
-    username: str, friends_bot_likelihood_scores: list
+@pytest.mark.parametrize(
+    "invalid_username, expected_log",
+    [
+        # An invalid username
+        (
+            "This is not a valid username",
+            "Failed to get @This is not a valid username's Twitter friends IDs.",
+        ),
+        # A Twitter bot that has no friends
+        (
+            "ProgressYearBar",
+            "Failed to get any friends IDs for @ProgressYearBar. It is likely that the account does not have any friends.",
+        ),
+    ],
+    ids=["invalid_username", "no_friends"],
+)
+@pytest.mark.twitter
+@pytest.mark.integration
+def test_get_friends_ids_err(
+    twitter_auth: tweepy.API, invalid_username: str, expected_log: str, caplog
 ) -> None:
-    """Test helpers.render_report() returns a string when the datetime_str parameter is an empty string.
+    """Test twtr.get_friends_ids() logs an error when provided an invalid username or a Twitter user
+        that is not following anyone (has no friends).
 
     Args:
-        username (str): A username provided by the pytest username fixture.
-        friends_bot_likelihood_scores (list): A list containing the bot likelihood scores for each Twitter friend.
+        twitter_auth (tweepy.API): A Tweepy.API object authenticated to the Twitter API.
+        invalid_username (str): The username to get Twitter friend IDs for, which causes an error.
+        expected_log (str): The error message expected in the logs.
+        caplog: A pytest caplog fixture used to examine application log messages.
     """
-    assert (
-        type(
-            helpers.render_report(
-                username=username,
-                friends_bot_likelihood_scores=friends_bot_likelihood_scores,
-                datetime_str="",
-            )
-        )
-        == str
-    )
+    # Consume the generator to collect the friend IDs
+    list(twtr.get_friends_ids(api=twitter_auth, username=invalid_username))
+    # Verify that an exception occurred in the logs
+    assert expected_log in caplog.text
 
 
+@pytest.mark.parametrize(
+    "empty_param, empty_value",
+    [
+        # Test with all parameters provided
+        (None, None),
+        # Test with each parameter empty in turn
+        ("username", ""),
+        ("friends_bot_likelihood_scores", {}),
+        ("datetime_str", ""),
+    ],
+    ids=["all_params", "no_username", "no_scores", "no_datetime"],
+)
 @pytest.mark.report
-def test_dump_report(
-    reports_test_dir: str,
+def test_render_report(
+    empty_param: str,
+    empty_value,
     username: str,
     friends_bot_likelihood_scores: list,
     _get_datetime: str,
 ) -> None:
-    """Test helpers.dump_report() creates a report file at the returned file path.
+    """Test helpers.render_report() returns a string when provided all parameters
+        and when each parameter is empty.
+
+    Fixtures cannot be used as parameters (https://github.com/pytest-dev/pytest/issues/349),
+    so the name of the parameter to make empty is parameterised instead.
 
     Args:
-        reports_test_dir (str): The relative path to the test reports directory.
+        empty_param (str): The name of the helpers.render_report() parameter to make empty.
+            None to provide all parameters.
+        empty_value: The empty value to provide for the parameter.
         username (str): A username provided by the pytest username fixture.
         friends_bot_likelihood_scores (list): A list containing the bot likelihood scores for each Twitter friend.
         _get_datetime (str): A string representing the current datetime.
     """
-    # Create test reports directory
-    reports_dir = helpers.create_reports_dir(reports_dir=reports_test_dir)
-    # Render the friends bot likelihood report from the template
-    report_render = helpers.render_report(
+    report_params = dict(
         username=username,
         friends_bot_likelihood_scores=friends_bot_likelihood_scores,
         datetime_str=_get_datetime,
     )
-    # Dump report render to a file in the test reports directory
-    report_file_path = helpers.dump_report(
-        report_render=report_render, reports_dir=reports_dir, username=username
-    )
+    # Make the parameter empty for this parameterised test
+    if empty_param is not None:
+        report_params[empty_param] = empty_value
+    assert type(helpers.render_report(**report_params)) == str
+
+
+@pytest.mark.report
+def test_dump_report(report_file_path: str) -> None:
+    """Test helpers.dump_report() creates a report file at the returned file path.
+
+    Args:
+        report_file_path (str): The path returned by helpers.dump_report() in the report_file_path fixture.
+    """
     # Check the report was dumped at the file path returned
     assert os.path.exists(report_file_path)
 
 
 @pytest.mark.email
+@pytest.mark.integration
 def test_send_email_report(
-    reports_test_dir: str,
-    friends_bot_likelihood_scores: list,
-    _get_datetime: str,
+    report_file_path: str,
     email: str,
     username: str,
     caplog,
@@ -856,9 +1039,7 @@ def test_send_email_report(
     """Test helpers.send_email_report() logs a success message when an email is sent successfully.
 
     Args:
-        reports_test_dir (str): The relative path to the test reports directory.
-        friends_bot_likelihood_scores (list): A list containing the bot likelihood scores for each Twitter friend.
-        _get_datetime (str): A string representing the current datetime.
+        report_file_path (str): The path to the friends bot likelihood report to attach.
         email (str): A email provided by the pytest email fixture.
         username (str): A username provided by the pytest username fixture.
         caplog: A pytest caplog fixture used to examine application log messages.
@@ -872,18 +1053,6 @@ def test_send_email_report(
             "EMAIL_SENDER_PASSWORD",
         ]
     )
-    # Create test reports directory
-    reports_dir = helpers.create_reports_dir(reports_dir=reports_test_dir)
-    # Render the friends bot likelihood report from the template
-    report_render = helpers.render_report(
-        username=username,
-        friends_bot_likelihood_scores=friends_bot_likelihood_scores,
-        datetime_str=_get_datetime,
-    )
-    # Dump report render to a file in the reports directory
-    report_file_path = helpers.dump_report(
-        report_render=report_render, reports_dir=reports_dir, username=username
-    )
     # Send email with report attached
     helpers.send_email_report(
         email_server=email_creds["EMAIL_SERVER_DOMAIN"],
@@ -898,3 +1067,199 @@ def test_send_email_report(
         f"Sent email to: {email} with the friends bot likelihood report attached."
         in caplog.text
     )
+
+
+@pytest.mark.email
+def test_send_email_report_mocked(
+    mocker: pytest_mock.MockerFixture,
+    report_file_path: str,
+    faker: faker.Faker,
+    caplog,
+) -> None:
+    """Test helpers.send_email_report() logs a success message when an email is sent successfully,
+    without connecting to an email server.
+
+    Args:
+        mocker (pytest_mock.MockerFixture): A mocker fixture for pytest.
+        report_file_path (str): The path to the friends bot likelihood report to attach.
+        faker: A faker fixture for pytest.
+        caplog: A pytest caplog fixture used to examine application log messages.
+    """
+    # Mock the SMTP_SSL class so no connection is made to an email server
+    mock_smtp_ssl = mocker.patch("modules.helpers.smtplib.SMTP_SSL")
+    email = faker.email()
+    # Send email with report attached
+    helpers.send_email_report(
+        email_server="smtp.example.com",
+        email_server_port=465,
+        email_sender_addr=faker.email(),
+        email_sender_pass="Password",
+        email_recipient_addr=email,
+        report_file_path=report_file_path,
+        username="ProgressYearBar",
+    )
+    # Check the email message was sent using the mocked connection
+    mock_smtp_ssl.return_value.send_message.assert_called_once()
+    assert (
+        f"Sent email to: {email} with the friends bot likelihood report attached."
+        in caplog.text
+    )
+
+
+@pytest.mark.email
+def test_connect_email_server(mocker: pytest_mock.MockerFixture) -> None:
+    """Test helpers.connect_email_server() connects and authenticates to the email server.
+
+    Args:
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
+    """
+    # Mock the SMTP_SSL class so no connection is made to an email server
+    mock_smtp_ssl = mocker.patch("modules.helpers.smtplib.SMTP_SSL")
+    smtp_connection = helpers.connect_email_server(
+        email_server="smtp.example.com",
+        email_server_port=465,
+        email_sender_addr="sender@example.com",
+        email_sender_pass="Password",
+    )
+    # Validate the connection is created with the correct parameters and authenticated
+    mock_smtp_ssl.assert_called_once_with(
+        host="smtp.example.com",
+        port=465,
+        timeout=helpers.EMAIL_SERVER_TIMEOUT,
+        context=helpers.get_ssl_context(),
+    )
+    mock_smtp_ssl.return_value.login.assert_called_once_with(
+        user="sender@example.com", password="Password"
+    )
+    assert smtp_connection == mock_smtp_ssl.return_value
+
+
+@pytest.mark.email
+def test_connect_email_server_auth_err(
+    mocker: pytest_mock.MockerFixture, caplog
+) -> None:
+    """Test helpers.connect_email_server() logs an error and closes the connection
+        when authentication to the email server fails.
+
+    Args:
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
+        caplog: A pytest caplog fixture used to examine application log messages.
+    """
+    # Mock the SMTP_SSL class and make the login method raise a SMTPAuthenticationError
+    mock_smtp_ssl = mocker.patch("modules.helpers.smtplib.SMTP_SSL")
+    mock_smtp_ssl.return_value.login.side_effect = smtplib.SMTPAuthenticationError(
+        535, b"Authentication failed"
+    )
+    smtp_connection = helpers.connect_email_server(
+        email_server="smtp.example.com",
+        email_server_port=465,
+        email_sender_addr="sender@example.com",
+        email_sender_pass="Password",
+    )
+    # Verify that an exception occurred in the logs and the connection is closed
+    assert (
+        "Failed to authenticate to the email server: smtp.example.com as: sender@example.com."
+        in caplog.text
+    )
+    mock_smtp_ssl.return_value.close.assert_called_once()
+    assert smtp_connection is None
+
+
+@pytest.mark.email
+def test_connect_email_server_timeout_err(
+    mocker: pytest_mock.MockerFixture, caplog
+) -> None:
+    """Test helpers.connect_email_server() logs an error when connecting to the email server times out.
+
+    Args:
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
+        caplog: A pytest caplog fixture used to examine application log messages.
+    """
+    # Mock the SMTP_SSL class to raise a timeout
+    mocker.patch("modules.helpers.smtplib.SMTP_SSL", side_effect=socket.timeout())
+    smtp_connection = helpers.connect_email_server(
+        email_server="smtp.example.com",
+        email_server_port=465,
+        email_sender_addr="sender@example.com",
+        email_sender_pass="Password",
+    )
+    # Verify that an exception occurred in the logs
+    assert (
+        "Failed to authenticate to the email server: smtp.example.com as: sender@example.com."
+        in caplog.text
+    )
+    assert smtp_connection is None
+
+
+@pytest.mark.email
+def test_send_email_report_smtp_connection(
+    mocker: pytest_mock.MockerFixture,
+    report_file_path: str,
+    caplog,
+) -> None:
+    """Test helpers.send_email_report() sends the email using the connection provided
+        and closes it once the email is sent.
+
+    Args:
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
+        report_file_path (str): The path to the friends bot likelihood report to attach.
+        caplog: A pytest caplog fixture used to examine application log messages.
+    """
+    # Mock the SMTP_SSL class to check a new connection is not created
+    mock_smtp_ssl = mocker.patch("modules.helpers.smtplib.SMTP_SSL")
+    smtp_connection = mocker.MagicMock()
+    helpers.send_email_report(
+        email_server="smtp.example.com",
+        email_server_port=465,
+        email_sender_addr="sender@example.com",
+        email_sender_pass="Password",
+        email_recipient_addr="recipient@example.com",
+        report_file_path=report_file_path,
+        username="ProgressYearBar",
+        smtp_connection=smtp_connection,
+    )
+    # Check the email message was sent using the connection provided and the connection is closed
+    mock_smtp_ssl.assert_not_called()
+    smtp_connection.send_message.assert_called_once()
+    smtp_connection.__exit__.assert_called_once()
+    assert (
+        "Sent email to: recipient@example.com with the friends bot likelihood report attached."
+        in caplog.text
+    )
+
+
+@pytest.mark.email
+def test_send_email_report_render(
+    mocker: pytest_mock.MockerFixture, tmp_path: pathlib.Path
+) -> None:
+    """Test helpers.send_email_report() attaches the report render provided
+        instead of reading the report file.
+
+    Args:
+        mocker (pytest_mock.MockerFixture): A pytest_mock.MockerFixture providing a
+            thin-wrapper around the patching API from the mock library.
+        tmp_path (pathlib.Path): A pytest fixture providing a temporary directory unique to the test.
+    """
+    report_render = "<html><body>Friends Bot Likelihood Report</body></html>"
+    smtp_connection = mocker.MagicMock()
+    helpers.send_email_report(
+        email_server="smtp.example.com",
+        email_server_port=465,
+        email_sender_addr="sender@example.com",
+        email_sender_pass="Password",
+        email_recipient_addr="recipient@example.com",
+        # The report file does not exist, so the report render must be attached
+        report_file_path=str(tmp_path / "ProgressYearBar_report.html"),
+        username="ProgressYearBar",
+        report_render=report_render,
+        smtp_connection=smtp_connection,
+    )
+    # Get the email message sent and check the attachment is the report render
+    message = smtp_connection.send_message.call_args.kwargs["msg"]
+    attachment = next(message.iter_attachments())
+    assert attachment.get_filename() == "ProgressYearBar_report.html"
+    assert attachment.get_content() == report_render.encode("utf-8")